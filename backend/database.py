@@ -44,8 +44,8 @@ class UserProgress(Base):
     time_taken = Column(Float)  # in seconds
     created_at = Column(DateTime, default=datetime.utcnow)
 
-def create_tables():
-    Base.metadata.create_all(bind=engine)
+def create_tables(bind=engine):
+    Base.metadata.create_all(bind=bind)
 
 def get_db():
     db = SessionLocal()
@@ -1,18 +1,36 @@
+import time
+IMPORT_STARTED = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 import os
 import tempfile
 import json
+import asyncio
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+load_dotenv()
 
-from database import get_db, create_tables, LearningSession, Quiz, UserProgress
-from services.ai_service import ai_service
-from services.sign_language_service import sign_language_service
+from database import get_db, SessionLocal, LearningSession, Quiz, UserProgress
+from services.quiz_service import clamp_num_questions
+from services.registry import registry
+
+# Services are built lazily and warmed in the background so new workers accept connections quickly
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await registry.prepare_database()
+    registry.start_warm_up()
+    print("EchoLearn API started successfully!")
+    yield
+    await registry.shutdown()
 
-app = FastAPI(title="EchoLearn API", description="AI Tutor for the Deaf and Hard of Hearing")
+app = FastAPI(title="EchoLearn API", description="AI Tutor for the Deaf and Hard of Hearing", lifespan=lifespan)
 
 # Enable CORS for frontend communication
 app.add_middleware(
@@ -23,12 +41,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create database tables on startup
-@app.on_event("startup")
-async def startup_event():
-    create_tables()
-    print("EchoLearn API started successfully!")
-
 # Static files for serving videos and assets
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -60,6 +72,25 @@ async def root():
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow()}
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive", "timestamp": datetime.utcnow()}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: background warm-up finished and the database is reachable"""
+    readiness = await registry.check_ready()
+    return JSONResponse(
+        status_code=200 if readiness["ready"] else 503,
+        content={"status": readiness["status"], "failed": readiness["failed"]}
+    )
+
+@app.get("/health/startup")
+async def startup_profile():
+    """Import-time and startup profiling report, in seconds"""
+    return registry.report()
+
 @app.post("/sessions/")
 async def create_session(title: str = "New Learning Session", db: Session = Depends(get_db)):
     """Create a new learning session"""
@@ -97,10 +128,10 @@ async def transcribe_audio(file: UploadFile = File(...), session_id: int = None,
     
     try:
         # Transcribe the audio
-        transcription = await ai_service.transcribe_audio(temp_file_path)
+        transcription = await registry.ai.transcribe_audio(temp_file_path)
         
         # Generate ASL translation
-        asl_data = await sign_language_service.translate_to_asl(transcription)
+        asl_data = await registry.sign_language.translate_to_asl(transcription)
         
         # Update session if provided
         if session_id:
@@ -131,7 +162,7 @@ async def summarize_content(session_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="No transcription found for this session")
     
     # Generate summary
-    summary = await ai_service.summarize_text(session.transcription)
+    summary = await registry.ai.summarize_text(session.transcription)
     
     # Update session
     session.summary = summary
@@ -139,6 +170,20 @@ async def summarize_content(session_id: int, db: Session = Depends(get_db)):
     
     return {"summary": summary, "session_id": session_id}
 
+def save_quiz_question(db: Session, session_id: int, q: Dict[str, Any]) -> Quiz:
+    """Persist a single validated quiz question"""
+    quiz = Quiz(
+        session_id=session_id,
+        question=q['question'],
+        options=json.dumps(q['options']),
+        correct_answer=q['correct_answer'],
+        explanation=q['explanation']
+    )
+    db.add(quiz)
+    db.commit()
+    db.refresh(quiz)
+    return quiz
+
 @app.post("/quiz/generate/")
 async def generate_quiz(session_id: int, num_questions: int = 3, db: Session = Depends(get_db)):
     """Generate quiz questions from session content"""
@@ -150,24 +195,19 @@ async def generate_quiz(session_id: int, num_questions: int = 3, db: Session = D
         raise HTTPException(status_code=400, detail="No transcription found for this session")
     
     # Generate quiz questions
-    quiz_data = await ai_service.generate_quiz(session.transcription, num_questions)
+    requested = clamp_num_questions(num_questions)
+    quiz_data = await registry.quiz.generate_quiz(session.transcription, requested)
     
     # Save quiz questions to database
-    quiz_ids = []
-    for q in quiz_data:
-        quiz = Quiz(
-            session_id=session_id,
-            question=q['question'],
-            options=json.dumps(q['options']),
-            correct_answer=q['correct_answer'],
-            explanation=q['explanation']
-        )
-        db.add(quiz)
-        db.commit()
-        db.refresh(quiz)
-        quiz_ids.append(quiz.id)
+    quiz_ids = [save_quiz_question(db, session_id, q).id for q in quiz_data]
     
-    return {"quiz_questions": quiz_data, "quiz_ids": quiz_ids, "session_id": session_id}
+    return {
+        "quiz_questions": quiz_data,
+        "quiz_ids": quiz_ids,
+        "session_id": session_id,
+        "requested": requested,
+        "delivered": len(quiz_data)
+    }
 
 @app.post("/quiz/answer/")
 async def submit_quiz_answer(
@@ -213,14 +253,14 @@ async def get_clarification(concept: str, session_id: int, db: Session = Depends
     session = db.query(LearningSession).filter(LearningSession.id == session_id).first()
     context = session.transcription if session else ""
     
-    clarification = await ai_service.get_clarification(concept, context)
+    clarification = await registry.ai.get_clarification(concept, context)
     
     return {"clarification": clarification, "concept": concept}
 
 @app.post("/asl/translate/")
 async def translate_to_asl(text: str):
     """Translate text to ASL"""
-    asl_data = await sign_language_service.translate_to_asl(text)
+    asl_data = await registry.sign_language.translate_to_asl(text)
     return asl_data
 
 @app.get("/progress/{session_id}")
@@ -243,10 +283,64 @@ async def get_user_progress(session_id: int, db: Session = Depends(get_db)):
         "progress_details": progress
     }
 
+async def stream_quiz_questions(websocket: WebSocket, session_id: int, num_questions: Any):
+    """Generate quiz questions and send each one over the WebSocket as soon as it is ready"""
+    try:
+        requested = clamp_num_questions(num_questions)
+    except (TypeError, ValueError):
+        await manager.send_personal_message(
+            json.dumps({"type": "quiz_error", "message": "num_questions must be an integer"}),
+            websocket
+        )
+        return
+    
+    db = SessionLocal()
+    try:
+        session = db.query(LearningSession).filter(LearningSession.id == session_id).first()
+        if not session or not session.transcription:
+            await manager.send_personal_message(
+                json.dumps({"type": "quiz_error", "message": "No transcription found for this session"}),
+                websocket
+            )
+            return
+        
+        quiz_ids = []
+        async for q in registry.quiz.stream_quiz(session.transcription, requested):
+            quiz = save_quiz_question(db, session_id, q)
+            quiz_ids.append(quiz.id)
+            await manager.send_personal_message(
+                json.dumps({"type": "quiz_question", "data": {**q, "id": quiz.id}, "index": len(quiz_ids) - 1}),
+                websocket
+            )
+        
+        await manager.send_personal_message(
+            json.dumps({
+                "type": "quiz_complete",
+                "quiz_ids": quiz_ids,
+                "session_id": session_id,
+                "requested": requested,
+                "delivered": len(quiz_ids)
+            }),
+            websocket
+        )
+    except Exception as e:
+        print(f"Error streaming quiz: {e}")
+        try:
+            await manager.send_personal_message(
+                json.dumps({"type": "quiz_error", "message": "Unable to generate quiz at this time."}),
+                websocket
+            )
+        except Exception:
+            # The socket is already closed, possibly the reason we got here
+            pass
+    finally:
+        db.close()
+
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: int):
     """WebSocket endpoint for real-time updates"""
     await manager.connect(websocket)
+    quiz_task: Optional[asyncio.Task] = None
     try:
         while True:
             data = await websocket.receive_text()
@@ -261,13 +355,31 @@ async def websocket_endpoint(websocket: WebSocket, session_id: int):
             elif message["type"] == "text_input":
                 # Handle real-time text translation
                 text = message["text"]
-                asl_data = await sign_language_service.translate_to_asl(text)
+                asl_data = await registry.sign_language.translate_to_asl(text)
                 await manager.send_personal_message(
                     json.dumps({"type": "asl_translation", "data": asl_data}),
                     websocket
                 )
+            elif message["type"] == "generate_quiz":
+                # Stream quiz questions in the background so other messages are still handled
+                if quiz_task and not quiz_task.done():
+                    await manager.send_personal_message(
+                        json.dumps({"type": "quiz_error", "message": "A quiz is already being generated"}),
+                        websocket
+                    )
+                else:
+                    quiz_task = asyncio.create_task(
+                        stream_quiz_questions(websocket, session_id, message.get("num_questions", 3))
+                    )
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Also reached on malformed frames, so a running quiz never outlives its socket
         manager.disconnect(websocket)
+        if quiz_task:
+            quiz_task.cancel()
+
+registry.mark_imported(IMPORT_STARTED)
 
 if __name__ == "__main__":
     import uvicorn
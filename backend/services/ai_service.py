@@ -1,15 +1,25 @@
-import openai
 import os
-import json
-import asyncio
-from typing import List, Dict, Any
-from dotenv import load_dotenv
-
-load_dotenv()
+import threading
 
 class AIService:
     def __init__(self):
-        self.openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self._openai_client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def openai_client(self):
+        """OpenAI client, built on first use so importing this module stays cheap"""
+        if self._openai_client is None:
+            # The startup warm-up thread and a request may both get here first
+            with self._client_lock:
+                if self._openai_client is None:
+                    import openai
+                    self._openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        return self._openai_client
+    
+    def warm_up(self):
+        """Import openai and build the client ahead of the first request"""
+        _ = self.openai_client
     
     async def transcribe_audio(self, audio_file_path: str) -> str:
         """Transcribe audio using OpenAI Whisper"""
@@ -48,31 +58,6 @@ class AIService:
             print(f"Error summarizing text: {e}")
             return "Unable to generate summary at this time."
     
-    async def generate_quiz(self, text: str, num_questions: int = 3) -> List[Dict[str, Any]]:
-        """Generate quiz questions from the content"""
-        try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are creating accessible quiz questions for deaf and hard-of-hearing students. Generate multiple choice questions based on the lecture content. Each question should test understanding of key concepts. Return your response as a JSON array with this format: [{'question': 'Question text?', 'options': ['A', 'B', 'C', 'D'], 'correct_answer': 'A', 'explanation': 'Why this is correct'}]"
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Create {num_questions} quiz questions from this content: {text}"
-                    }
-                ],
-                max_tokens=1000,
-                temperature=0.5
-            )
-            
-            quiz_data = json.loads(response.choices[0].message.content)
-            return quiz_data
-        except Exception as e:
-            print(f"Error generating quiz: {e}")
-            return []
-    
     async def get_clarification(self, concept: str, context: str) -> str:
         """Provide clarification for specific concepts"""
         try:
@@ -95,5 +80,3 @@ class AIService:
         except Exception as e:
             print(f"Error getting clarification: {e}")
             return "Unable to provide clarification at this time."
-
-ai_service = AIService() 
\ No newline at end of file
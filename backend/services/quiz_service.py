@@ -0,0 +1,190 @@
+import json
+import re
+import asyncio
+from typing import List, Dict, Any, Optional, AsyncIterator
+from pydantic import BaseModel, ValidationError, field_validator, model_validator
+
+SIMILARITY_THRESHOLD = 0.8
+MAX_ATTEMPTS = 3
+MIN_QUESTIONS = 1
+MAX_QUESTIONS = 10
+MAX_CONCURRENT_REQUESTS = 4
+RETRY_DELAY = 1.0  # seconds, doubled after each failed API call
+
+def clamp_num_questions(value: Any) -> int:
+    """Coerce a requested question count to an int between MIN_QUESTIONS and MAX_QUESTIONS"""
+    return max(MIN_QUESTIONS, min(int(value), MAX_QUESTIONS))
+
+def extract_json_object(raw: Optional[str]) -> str:
+    """Return the outermost {...} in a model reply, dropping code fences or surrounding prose"""
+    raw = raw or ""
+    start, end = raw.find("{"), raw.rfind("}")
+    if start == -1 or end < start:
+        return raw
+    return raw[start:end + 1]
+
+def is_transient_error(error: Exception) -> bool:
+    """Rate limits, timeouts, connection drops and 5xx responses are worth retrying"""
+    # openai is already imported by the time a request has failed, so this stays cheap
+    import openai
+    return isinstance(error, (
+        openai.APIConnectionError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+        TimeoutError,
+        ConnectionError,
+    ))
+
+def is_api_error(error: Exception) -> bool:
+    """Any other OpenAI failure (bad key, bad request) that retrying won't fix"""
+    import openai
+    return isinstance(error, openai.OpenAIError)
+
+class QuizQuestion(BaseModel):
+    question: str
+    options: List[str]
+    correct_answer: str
+    explanation: str
+
+    @field_validator("question", "correct_answer", "explanation")
+    @classmethod
+    def not_blank(cls, value: str) -> str:
+        value = value.strip()
+        if not value:
+            raise ValueError("must not be blank")
+        return value
+
+    @field_validator("options")
+    @classmethod
+    def four_distinct_options(cls, value: List[str]) -> List[str]:
+        value = [option.strip() for option in value]
+        if len(value) != 4 or len(set(value)) != 4 or not all(value):
+            raise ValueError("must be 4 distinct, non-empty options")
+        return value
+
+    @model_validator(mode="after")
+    def answer_is_an_option(self) -> "QuizQuestion":
+        if self.correct_answer not in self.options:
+            raise ValueError("correct_answer must match one of the options")
+        return self
+
+class QuizService:
+    """Generates quiz questions concurrently, one per transcript section"""
+
+    def __init__(self, ai):
+        self.ai = ai
+
+    def split_sections(self, text: str, num_sections: int) -> List[str]:
+        """Split text into up to num_sections contiguous runs of sentences"""
+        pieces = [s for s in re.split(r"(?<=[.!?])\s+", text.strip()) if s]
+        if len(pieces) < num_sections:
+            # Unpunctuated transcripts come back as one long "sentence"; split by words instead
+            pieces = text.split()
+        if not pieces:
+            return []
+        num_sections = max(1, min(num_sections, len(pieces)))
+        size, extra = divmod(len(pieces), num_sections)
+        sections, start = [], 0
+        for i in range(num_sections):
+            end = start + size + (1 if i < extra else 0)
+            sections.append(" ".join(pieces[start:end]))
+            start = end
+        return sections
+
+    def _tokens(self, question: str) -> set:
+        return set(re.findall(r"[a-z0-9]+", question.lower()))
+
+    def is_duplicate(self, question: Dict[str, Any], accepted: List[Dict[str, Any]]) -> bool:
+        """Check whether a question is near-identical (Jaccard similarity) to an accepted one"""
+        tokens = self._tokens(question["question"])
+        for other in accepted:
+            other_tokens = self._tokens(other["question"])
+            union = tokens | other_tokens
+            if union and len(tokens & other_tokens) / len(union) >= SIMILARITY_THRESHOLD:
+                return True
+        return False
+
+    def _request_question(self, section: str, avoid: List[str]) -> str:
+        avoid_text = ""
+        if avoid:
+            avoid_text = " Do not repeat any of these questions: " + " | ".join(avoid)
+        response = self.ai.openai_client.chat.completions.create(
+            model="gpt-4",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are creating accessible quiz questions for deaf and hard-of-hearing students. Write ONE multiple choice question that tests understanding of a key concept in the given section. Return only a JSON object with this format: {\"question\": \"Question text?\", \"options\": [\"option 1\", \"option 2\", \"option 3\", \"option 4\"], \"correct_answer\": \"the correct option, copied exactly\", \"explanation\": \"Why this is correct\"}"
+                },
+                {
+                    "role": "user",
+                    "content": f"Create one quiz question from this section of the lecture: {section}{avoid_text}"
+                }
+            ],
+            max_tokens=350,
+            temperature=0.5
+        )
+        return response.choices[0].message.content
+
+    async def _generate_question(self, section: str, accepted: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Generate and validate one question, regenerating it on API errors, invalid or duplicate output"""
+        for attempt in range(MAX_ATTEMPTS):
+            avoid = [q["question"] for q in accepted]
+            try:
+                async with semaphore:
+                    raw = await asyncio.to_thread(self._request_question, section, avoid)
+                question = QuizQuestion.model_validate(json.loads(extract_json_object(raw))).model_dump()
+            except (json.JSONDecodeError, ValidationError) as e:
+                print(f"Invalid quiz question (attempt {attempt + 1}): {e}")
+                continue
+            except Exception as e:
+                if is_transient_error(e):
+                    print(f"Error generating quiz question (attempt {attempt + 1}): {e}")
+                    if attempt < MAX_ATTEMPTS - 1:
+                        await asyncio.sleep(RETRY_DELAY * 2 ** attempt)
+                    continue
+                if is_api_error(e):
+                    print(f"Error generating quiz question: {e}")
+                    return None
+                raise
+
+            # No await between the check and the append, so concurrent tasks can't race here
+            if self.is_duplicate(question, accepted):
+                print(f"Duplicate quiz question (attempt {attempt + 1}), regenerating")
+                continue
+            accepted.append(question)
+            return question
+        return None
+
+    def _start_question_tasks(self, text: str, num_questions: int) -> List[asyncio.Task]:
+        """Start one generation task per question, in transcript order"""
+        num_questions = clamp_num_questions(num_questions)
+        sections = self.split_sections(text, num_questions)
+        if not sections:
+            return []
+        # Short transcripts have fewer sentences than questions; reuse sections round-robin
+        sections = [sections[i % len(sections)] for i in range(num_questions)]
+        accepted: List[Dict[str, Any]] = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return [asyncio.create_task(self._generate_question(s, accepted, semaphore)) for s in sections]
+
+    async def stream_quiz(self, text: str, num_questions: int = 3) -> AsyncIterator[Dict[str, Any]]:
+        """Yield validated quiz questions as soon as each one is ready"""
+        tasks = self._start_question_tasks(text, num_questions)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                question = await next_done
+                if question is not None:
+                    yield question
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def generate_quiz(self, text: str, num_questions: int = 3) -> List[Dict[str, Any]]:
+        """Generate quiz questions from the content, in transcript order"""
+        tasks = self._start_question_tasks(text, num_questions)
+        try:
+            questions = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return [question for question in questions if question is not None]
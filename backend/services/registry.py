@@ -0,0 +1,126 @@
+import time
+import asyncio
+import threading
+from typing import Dict, Any, List, Optional
+from sqlalchemy import text
+
+import database
+from services.ai_service import AIService
+from services.quiz_service import QuizService
+from services.sign_language_service import SignLanguageService
+
+class ServiceRegistry:
+    """Builds services on first use and warms them up in the background at startup"""
+
+    def __init__(self, engine=None):
+        self.engine = engine if engine is not None else database.engine
+        self._services: Dict[str, Any] = {}
+        self._factories = {
+            "ai": AIService,
+            "sign_language": SignLanguageService,
+            "quiz": lambda: QuizService(self.ai),
+        }
+        self._lock = threading.RLock()
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._import_started: Optional[float] = None
+        self.warmed_up = False
+        self.failed_steps: List[str] = []
+        self.profile: Dict[str, Any] = {"warm_up": {}}
+
+    def mark_imported(self, started: float):
+        """Record how long the app module took to import, measured from `started`"""
+        self._import_started = started
+        self.profile["import"] = time.perf_counter() - started
+
+    def get(self, name: str) -> Any:
+        """Return the named service, building it on first use"""
+        service = self._services.get(name)
+        if service is None:
+            # Warm-up threads and request handlers may ask for the same service at once
+            with self._lock:
+                service = self._services.get(name)
+                if service is None:
+                    started = time.perf_counter()
+                    service = self._factories[name]()
+                    self._services[name] = service
+                    self.profile.setdefault("build", {})[name] = time.perf_counter() - started
+        return service
+
+    @property
+    def ai(self) -> AIService:
+        return self.get("ai")
+
+    @property
+    def sign_language(self) -> SignLanguageService:
+        return self.get("sign_language")
+
+    @property
+    def quiz(self) -> QuizService:
+        return self.get("quiz")
+
+    async def prepare_database(self):
+        """Create tables before serving traffic; cheap, and requests fail without them"""
+        started = time.perf_counter()
+        await asyncio.to_thread(database.create_tables, self.engine)
+        self.profile["create_tables"] = time.perf_counter() - started
+
+    def _ping_database(self):
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    def _warm_sign_language(self):
+        self.get("sign_language")
+
+    def _warm_ai(self):
+        self.ai.warm_up()
+
+    async def _run_step(self, name: str, step):
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(step)
+        except Exception as e:
+            self.failed_steps.append(name)
+            print(f"Error warming up {name}: {e}")
+        self.profile["warm_up"][name] = time.perf_counter() - started
+
+    async def warm_up(self):
+        """Warm the ASL lexicon and OpenAI client concurrently"""
+        started = time.perf_counter()
+        await asyncio.gather(
+            self._run_step("sign_language", self._warm_sign_language),
+            self._run_step("ai", self._warm_ai),
+        )
+        self.profile["warm_up_total"] = time.perf_counter() - started
+        if self._import_started is not None:
+            self.profile["import_to_ready"] = time.perf_counter() - self._import_started
+        self.warmed_up = True
+        print(f"EchoLearn warm-up finished: {self.report()}")
+
+    def start_warm_up(self):
+        self._warm_up_task = asyncio.create_task(self.warm_up())
+
+    async def shutdown(self):
+        if self._warm_up_task and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+            try:
+                await self._warm_up_task
+            except asyncio.CancelledError:
+                pass
+
+    async def check_ready(self) -> Dict[str, Any]:
+        """Ready once warm-up has finished and the database answers right now"""
+        if not self.warmed_up:
+            return {"ready": False, "status": "warming_up", "failed": self.failed_steps}
+        try:
+            await asyncio.to_thread(self._ping_database)
+        except Exception as e:
+            print(f"Readiness check failed, database unreachable: {e}")
+            return {"ready": False, "status": "unavailable", "failed": self.failed_steps + ["database"]}
+        # AI features degrade gracefully, so a failed AI warm-up doesn't block traffic
+        return {"ready": True, "status": "ready", "failed": self.failed_steps}
+
+    def report(self) -> Dict[str, Any]:
+        """Import-time and startup profile, in seconds"""
+        return {"warmed_up": self.warmed_up, "failed": self.failed_steps, **self.profile}
+
+registry = ServiceRegistry()
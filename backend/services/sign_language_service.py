@@ -1,10 +1,6 @@
-import requests
 import os
 import json
 from typing import Dict, Any, List
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class SignLanguageService:
     def __init__(self):
@@ -52,6 +48,7 @@ class SignLanguageService:
         }
         
         try:
+            import requests
             response = requests.post(
                 f"{self.base_url}/translate",
                 headers=headers,
@@ -155,5 +152,3 @@ class SignLanguageService:
         }
         
         return video_mapping.get(gesture, "/videos/asl/default.mp4")
-
-sign_language_service = SignLanguageService() 
\ No newline at end of file
@@ -0,0 +1,165 @@
+import json
+import time
+import asyncio
+import httpx
+import openai
+import pytest
+from pydantic import ValidationError
+
+from services import quiz_service
+from services.quiz_service import QuizQuestion, QuizService, clamp_num_questions
+
+def make_question(question="What is photosynthesis?", answer="Making food from light"):
+    return {
+        "question": question,
+        "options": [answer, "Breathing", "Sleeping", "Running"],
+        "correct_answer": answer,
+        "explanation": "Plants turn light into energy."
+    }
+
+class StubQuizService(QuizService):
+    """QuizService whose API calls return queued responses instead of hitting OpenAI"""
+
+    def __init__(self, responses):
+        super().__init__(ai=None)
+        self.responses = list(responses)
+        self.calls = []
+
+    def _request_question(self, section, avoid):
+        self.calls.append((section, avoid))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response if isinstance(response, str) else json.dumps(response)
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(quiz_service, "RETRY_DELAY", 0)
+
+def generate(service, text, num_questions):
+    return asyncio.run(service.generate_quiz(text, num_questions))
+
+@pytest.mark.parametrize("changes", [
+    {"options": ["A", "B", "C"]},
+    {"options": ["A", "A", "B", "C"]},
+    {"correct_answer": "Not an option"},
+    {"question": "   "},
+])
+def test_question_validation_rejects_bad_output(changes):
+    with pytest.raises(ValidationError):
+        QuizQuestion.model_validate({**make_question(), **changes})
+
+def test_clamp_num_questions():
+    assert clamp_num_questions("3") == 3
+    assert clamp_num_questions(0) == quiz_service.MIN_QUESTIONS
+    assert clamp_num_questions(500) == quiz_service.MAX_QUESTIONS
+    with pytest.raises(ValueError):
+        clamp_num_questions("three")
+
+def test_split_sections_keeps_transcript_order():
+    service = QuizService(ai=None)
+    sections = service.split_sections("One. Two. Three. Four. Five.", 2)
+    assert sections == ["One. Two. Three.", "Four. Five."]
+
+def test_is_duplicate_matches_near_identical_questions():
+    service = QuizService(ai=None)
+    accepted = [make_question("What is photosynthesis?")]
+    assert service.is_duplicate(make_question("what is Photosynthesis"), accepted)
+    assert not service.is_duplicate(make_question("Where does respiration happen?"), accepted)
+
+def test_invalid_output_is_regenerated():
+    service = StubQuizService(["not json", {**make_question(), "correct_answer": "Nope"}, make_question()])
+    assert generate(service, "Plants use light.", 1) == [make_question()]
+    assert len(service.calls) == 3
+
+def test_fenced_json_is_accepted_first_time():
+    fenced = "```json\n" + json.dumps(make_question()) + "\n```"
+    service = StubQuizService([fenced])
+    assert generate(service, "Plants use light.", 1) == [make_question()]
+    assert len(service.calls) == 1
+
+def test_transient_api_errors_are_retried():
+    timeout = openai.APITimeoutError(request=httpx.Request("POST", "https://api.openai.com"))
+    service = StubQuizService([timeout, make_question()])
+    assert generate(service, "Plants use light.", 1) == [make_question()]
+
+def test_permanent_api_errors_are_not_retried():
+    service = StubQuizService([openai.OpenAIError("missing api key"), make_question()])
+    assert generate(service, "Plants use light.", 1) == []
+    assert len(service.calls) == 1
+
+def test_programming_errors_are_raised():
+    service = StubQuizService([AttributeError("'NoneType' object has no attribute 'chat'")])
+    with pytest.raises(AttributeError):
+        generate(service, "Plants use light.", 1)
+
+def test_duplicates_are_regenerated_with_accepted_questions_avoided():
+    first = make_question("What is photosynthesis?")
+    second = make_question("Where does respiration happen?")
+    service = StubQuizService([first, first, second])
+    questions = generate(service, "Plants use light. Cells respire.", 2)
+    assert questions == [first, second]
+    assert service.calls[-1][1] == ["What is photosynthesis?"]
+
+def test_unpunctuated_transcript_is_split_by_words():
+    service = QuizService(ai=None)
+    sections = service.split_sections("so today we talk about plants and how they use light", 3)
+    assert sections == ["so today we talk", "about plants and how", "they use light"]
+
+def test_short_transcript_reuses_sections_round_robin():
+    service = StubQuizService([make_question(f"Question number {i}?") for i in range(3)])
+    questions = generate(service, "Photosynthesis.", 3)
+    assert len(questions) == 3
+    assert [section for section, _ in service.calls] == ["Photosynthesis."] * 3
+
+def test_question_is_dropped_after_max_attempts():
+    service = StubQuizService(["not json"] * quiz_service.MAX_ATTEMPTS)
+    assert generate(service, "Plants use light.", 1) == []
+    assert len(service.calls) == quiz_service.MAX_ATTEMPTS
+
+def test_generate_quiz_returns_questions_in_transcript_order():
+    class SlowFirstSection(StubQuizService):
+        def _request_question(self, section, avoid):
+            if section.startswith("First"):
+                time.sleep(0.05)
+                return json.dumps(make_question("About the first section?"))
+            return json.dumps(make_question("About the second section?"))
+
+    service = SlowFirstSection([])
+    questions = generate(service, "First part. Second part.", 2)
+    assert [q["question"] for q in questions] == ["About the first section?", "About the second section?"]
+
+class DelayedQuizService(QuizService):
+    """Each section's question takes as many seconds as the section's number / 100"""
+
+    def __init__(self):
+        super().__init__(ai=None)
+        self.cancelled = []
+
+    async def _generate_question(self, section, accepted, semaphore):
+        try:
+            await asyncio.sleep(int(section.rstrip(".")) / 100)
+        except asyncio.CancelledError:
+            self.cancelled.append(section)
+            raise
+        return make_question(f"About section {section}")
+
+def test_stream_quiz_yields_in_completion_order():
+    async def collect():
+        service = DelayedQuizService()
+        return [q["question"] async for q in service.stream_quiz("3. 1. 2.", 3)]
+
+    assert asyncio.run(collect()) == ["About section 1.", "About section 2.", "About section 3."]
+
+def test_closing_stream_cancels_remaining_questions():
+    async def take_first():
+        service = DelayedQuizService()
+        stream = service.stream_quiz("1. 20. 30.", 3)
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+        return first, service.cancelled
+
+    first, cancelled = asyncio.run(take_first())
+    assert first["question"] == "About section 1."
+    assert sorted(cancelled) == ["20.", "30."]
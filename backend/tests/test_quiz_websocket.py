@@ -0,0 +1,128 @@
+import os
+import json
+import asyncio
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import database
+from services.registry import ServiceRegistry
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class StubQuiz:
+    """Streams numbered questions, then optionally waits until cancelled"""
+
+    def __init__(self, hang=False):
+        self.hang = hang
+        self.requested = None
+        self.cancelled = threading.Event()
+
+    async def stream_quiz(self, text, num_questions):
+        self.requested = num_questions
+        for i in range(num_questions):
+            yield {
+                "question": f"Question {i}?",
+                "options": ["A", "B", "C", "D"],
+                "correct_answer": "A",
+                "explanation": "Because."
+            }
+        if self.hang:
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.cancelled.set()
+                raise
+
+@pytest.fixture
+def app(monkeypatch):
+    # main mounts ./static, so it must be imported from backend/
+    monkeypatch.chdir(BACKEND_DIR)
+    import main
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.create_tables(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(main, "SessionLocal", session_factory)
+
+    db = session_factory()
+    session = database.LearningSession(title="Plants", transcription="Plants use light.")
+    db.add(session)
+    db.commit()
+    session_id = session.id
+    db.close()
+
+    test_registry = ServiceRegistry(engine=engine)
+    monkeypatch.setattr(main, "registry", test_registry)
+
+    def use_quiz(stub):
+        test_registry._services["quiz"] = stub
+        return stub
+
+    return TestClient(main.app), session_id, use_quiz, session_factory
+
+def receive(ws):
+    return json.loads(ws.receive_text())
+
+def test_questions_stream_then_complete(app):
+    client, session_id, use_quiz, session_factory = app
+    use_quiz(StubQuiz())
+    with client.websocket_connect(f"/ws/{session_id}") as ws:
+        ws.send_text(json.dumps({"type": "generate_quiz", "num_questions": 2}))
+        first, second, complete = receive(ws), receive(ws), receive(ws)
+
+    assert [first["type"], second["type"]] == ["quiz_question", "quiz_question"]
+    assert [first["index"], second["index"]] == [0, 1]
+    assert complete["type"] == "quiz_complete"
+    assert complete["quiz_ids"] == [first["data"]["id"], second["data"]["id"]]
+    assert (complete["requested"], complete["delivered"]) == (2, 2)
+
+    db = session_factory()
+    assert db.query(database.Quiz).filter(database.Quiz.session_id == session_id).count() == 2
+    db.close()
+
+def test_num_questions_is_validated_and_clamped(app):
+    client, session_id, use_quiz, _ = app
+    stub = use_quiz(StubQuiz())
+    with client.websocket_connect(f"/ws/{session_id}") as ws:
+        ws.send_text(json.dumps({"type": "generate_quiz", "num_questions": "three"}))
+        assert receive(ws) == {"type": "quiz_error", "message": "num_questions must be an integer"}
+
+        ws.send_text(json.dumps({"type": "generate_quiz", "num_questions": "500"}))
+        messages = [receive(ws) for _ in range(11)]
+    assert stub.requested == 10
+    assert messages[-1]["type"] == "quiz_complete"
+
+def test_second_quiz_is_rejected_while_generating(app):
+    client, session_id, use_quiz, _ = app
+    stub = use_quiz(StubQuiz(hang=True))
+    with client.websocket_connect(f"/ws/{session_id}") as ws:
+        ws.send_text(json.dumps({"type": "generate_quiz", "num_questions": 1}))
+        assert receive(ws)["type"] == "quiz_question"
+
+        ws.send_text(json.dumps({"type": "generate_quiz", "num_questions": 1}))
+        assert receive(ws) == {"type": "quiz_error", "message": "A quiz is already being generated"}
+
+        # Other messages are still handled while the quiz is generating
+        ws.send_text(json.dumps({"type": "text_input", "text": "hello"}))
+        assert receive(ws)["type"] == "asl_translation"
+
+    assert stub.cancelled.wait(timeout=5)
+
+def test_malformed_frame_cancels_quiz(app):
+    client, session_id, use_quiz, _ = app
+    import main
+    stub = use_quiz(StubQuiz(hang=True))
+    with pytest.raises(json.JSONDecodeError):
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            ws.send_text(json.dumps({"type": "generate_quiz", "num_questions": 1}))
+            assert receive(ws)["type"] == "quiz_question"
+            ws.send_text("not json")
+            # Checked before the client shuts down its event loop, which would cancel the task anyway
+            cancelled_by_handler = stub.cancelled.wait(timeout=2)
+            ws.receive_text()
+
+    assert cancelled_by_handler
+    assert main.manager.active_connections == []
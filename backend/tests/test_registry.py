@@ -0,0 +1,85 @@
+import os
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from services.ai_service import AIService
+from services.registry import ServiceRegistry
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def memory_registry():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    return ServiceRegistry(engine=engine)
+
+@pytest.fixture
+def client(monkeypatch):
+    # main mounts ./static, so it must be imported from backend/
+    monkeypatch.chdir(BACKEND_DIR)
+    import main
+    test_registry = memory_registry()
+    monkeypatch.setattr(main, "registry", test_registry)
+    # No `with` block, so the real lifespan (and its database) never runs
+    return TestClient(main.app), test_registry
+
+def test_service_is_built_once():
+    registry = memory_registry()
+    calls = []
+    registry._factories["sign_language"] = lambda: calls.append(1) or object()
+    assert registry.sign_language is registry.sign_language
+    assert len(calls) == 1
+
+def test_quiz_service_shares_the_ai_service():
+    registry = memory_registry()
+    assert registry.quiz.ai is registry.ai
+
+def test_readiness_flips_after_warm_up(client, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    http, registry = client
+    assert http.get("/health/live").status_code == 200
+    assert http.get("/health/ready").status_code == 503
+
+    asyncio.run(registry.warm_up())
+
+    response = http.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "failed": []}
+
+def test_database_failure_reports_step_name_only(client, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    http, registry = client
+    registry.engine = create_engine("sqlite:////nonexistent/dir/secret-name.db")
+    asyncio.run(registry.warm_up())
+
+    response = http.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable", "failed": ["database"]}
+    assert "secret-name" not in http.get("/health/startup").text
+
+def test_failed_ai_warm_up_does_not_block_readiness(monkeypatch):
+    def fail_warm_up(self):
+        raise RuntimeError("no key")
+
+    registry = memory_registry()
+    monkeypatch.setattr(AIService, "warm_up", fail_warm_up)
+    asyncio.run(registry.warm_up())
+    readiness = asyncio.run(registry.check_ready())
+    assert readiness["ready"] is True
+    assert readiness["failed"] == ["ai"]
+
+def test_prepare_database_creates_tables():
+    registry = memory_registry()
+    asyncio.run(registry.prepare_database())
+    with registry.engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT COUNT(*) FROM quizzes").scalar() == 0
+
+def test_ai_client_is_built_lazily(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    service = AIService()
+    assert service._openai_client is None
+    service.warm_up()
+    client = service._openai_client
+    assert client is not None
+    assert service.openai_client is client